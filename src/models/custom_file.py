@@ -7,13 +7,22 @@ and outputs a single JSON dataset.
 
 import json
 import logging
+import os
 import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 import requests
-from requests.exceptions import RequestException, Timeout, ConnectionError, HTTPError
+from requests.adapters import HTTPAdapter
+from requests.exceptions import RequestException
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional, falls back to the stdlib json module
+    orjson = None
 
 # Configure logging
 logging.basicConfig(
@@ -29,7 +38,9 @@ logger = logging.getLogger(__name__)
 API_URL = "https://meowfacts.herokuapp.com/"
 API_TIMEOUT = 30  # seconds
 DEFAULT_FACT_COUNT = 200
+MAX_WORKERS = 4  # concurrent language fetches
 OUTPUT_FILE = "requested_dataset.json"
+CACHE_DIR = ".meowfacts_cache"  # raw API responses, one file per (lang, count, UTC day)
 
 # Supported languages extracted from API docs & repo
 SUPPORTED_LANGUAGES = [
@@ -37,18 +48,108 @@ SUPPORTED_LANGUAGES = [
     "fil", "ukr", "urd", "ita", "zho", "kor"
 ]
 
+# Shared HTTP session so every language fetch reuses one keep-alive connection
+_SESSION = requests.Session()
+_SESSION.headers.update({"Accept": "application/json"})
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=MAX_WORKERS,
+        max_retries=Retry(
+            total=3,
+            read=False,  # re-raise read timeouts as-is, they already cost API_TIMEOUT
+            backoff_factor=0.3,
+            status_forcelist=[500, 502, 503, 504],  # 429 fails fast rather than add load
+            allowed_methods=["GET"],
+            respect_retry_after_header=False  # keep backoff bounded on 503
+        )
+    )
+)
+
 
 def get_timestamp() -> str:
     """Return current processing timestamp in ISO format."""
     return datetime.utcnow().isoformat() + "Z"
 
 
-def fetch_meowfacts(lang: str, count: int = DEFAULT_FACT_COUNT) -> List[Dict[str, Any]]:
+def _batch_uuids(n: int) -> List[str]:
+    """Return n random UUID4 strings drawn from a single urandom call."""
+    raw = os.urandom(16 * n)
+    return [str(uuid.UUID(bytes=raw[i:i + 16], version=4)) for i in range(0, 16 * n, 16)]
+
+
+def _fetch_raw_facts(lang: str, count: int) -> List[Any]:
+    """
+    Return the raw fact list for a language, reusing today's cached response if present.
+
+    Only non-empty responses are cached, and files from previous UTC days are
+    removed whenever a new one is written. Delete CACHE_DIR to force a fresh download.
+
+    :param lang: ISO 639-2 code
+    :param count: number of facts to request
+    :return: list of facts as returned by the API
+    :raises: RequestException, ValueError
+    """
+    cache_dir = Path(CACHE_DIR)
+    cache_day = datetime.utcnow().date().isoformat()
+    cache_file = cache_dir / f"{lang}_{count}_{cache_day}.json"
+
+    try:
+        with open(cache_file, "rb") as f:
+            facts = json.loads(f.read())
+        if isinstance(facts, list):
+            logger.info(f"Using cached facts for language '{lang}' from {cache_file}")
+            return facts
+        logger.warning(f"Ignoring malformed cache file '{cache_file}'")
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable cache file '{cache_file}': {e}")
+
+    params = {"lang": lang, "count": count}
+    logger.debug(f"Fetching facts for language '{lang}' with count={count}")
+
+    response = _SESSION.get(API_URL, params=params, timeout=API_TIMEOUT)
+    response.raise_for_status()
+
+    data = orjson.loads(response.content) if orjson is not None else response.json()
+    facts = data.get("data", [])
+
+    if not isinstance(facts, list):
+        logger.warning(f"Expected list of facts for language '{lang}', got {type(facts)}")
+        return []
+
+    if not facts:
+        logger.warning(f"API returned no facts for language '{lang}', not caching")
+        return facts
+
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        for stale_file in cache_dir.iterdir():
+            if stale_file.suffix in (".json", ".tmp") and not stale_file.stem.endswith(f"_{cache_day}"):
+                stale_file.unlink(missing_ok=True)
+        tmp_file = cache_file.with_suffix(".tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(facts, f, ensure_ascii=False)
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        logger.warning(f"Could not cache facts for language '{lang}': {e}")
+
+    return facts
+
+
+def fetch_meowfacts(
+    lang: str,
+    count: int = DEFAULT_FACT_COUNT,
+    processed_timestamp: Optional[str] = None
+) -> List[Dict[str, Any]]:
     """
     Fetch multiple meowfacts for a given language.
 
     :param lang: ISO 639-2 code
     :param count: number of facts to request
+    :param processed_timestamp: timestamp shared by the whole run; generated if omitted
     :return: list of dicts with language and fact
     :raises: RequestException, ValueError
     """
@@ -59,48 +160,34 @@ def fetch_meowfacts(lang: str, count: int = DEFAULT_FACT_COUNT) -> List[Dict[str
         raise ValueError(f"Count must be between 1 and 1000, got: {count}")
 
     try:
-        params = {"lang": lang, "count": count}
-        logger.debug(f"Fetching facts for language '{lang}' with count={count}")
-
-        response = requests.get(API_URL, params=params, timeout=API_TIMEOUT)
-        response.raise_for_status()
-
-        data = response.json()
-        facts = data.get("data", [])
-
-        if not isinstance(facts, list):
-            logger.warning(f"Expected list of facts for language '{lang}', got {type(facts)}")
-            facts = []
-
-        processed_timestamp = get_timestamp()
-
-        result = [
-            {
-                "event_id": str(uuid.uuid4()),
-                "processing_timestamp": processed_timestamp,
-                "language": lang,
-                "fact": str(fact)  # Ensure fact is a string
-            }
-            for fact in facts
-        ]
+        facts = list(map(str, _fetch_raw_facts(lang, count)))  # Ensure facts are strings
+
+        processed_timestamp = processed_timestamp or get_timestamp()
+
+        # Fields shared by every row in this batch are filled in once
+        template = {
+            "event_id": None,
+            "processing_timestamp": processed_timestamp,
+            "language": lang,
+            "fact": None
+        }
+        result = []
+        append = result.append
+        for fact, event_id in zip(facts, _batch_uuids(len(facts))):
+            row = template.copy()
+            row["event_id"] = event_id
+            row["fact"] = fact
+            append(row)
 
         logger.info(f"Successfully fetched {len(result)} facts for language '{lang}'")
         return result
 
-    except Timeout:
-        logger.error(f"Timeout while fetching facts for language '{lang}'")
-        raise
-    except ConnectionError as e:
-        logger.error(f"Connection error while fetching facts for language '{lang}': {e}")
-        raise
-    except HTTPError as e:
-        logger.error(f"HTTP error while fetching facts for language '{lang}': {e} (Status: {response.status_code})")
-        raise
     except (KeyError, json.JSONDecodeError) as e:
         logger.error(f"Error parsing response for language '{lang}': {e}")
         raise ValueError(f"Invalid API response format for language '{lang}'") from e
     except RequestException as e:
-        logger.error(f"Request exception while fetching facts for language '{lang}': {e}")
+        # Transient failures were already retried by the session's HTTPAdapter
+        logger.error(f"Request failed while fetching facts for language '{lang}': {e}")
         raise
 
 
@@ -119,8 +206,14 @@ def write_output_file(data: List[Dict[str, Any]], output_path: str) -> None:
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # Serialize the whole payload up front and write it in one call
+        if orjson is not None:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+        with open(output_file, "wb") as f:
+            f.write(payload)
 
         logger.info(f"Successfully wrote {len(data)} records to {output_path}")
 
@@ -138,23 +231,33 @@ def main() -> None:
 
     :raises: ValueError, IOError, OSError
     """
-    all_facts = []
+    facts_by_language = {}
     failed_languages = []
 
     logger.info("Starting Meowfacts extraction")
-
+    processed_timestamp = get_timestamp()
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        future_to_lang = {
+            executor.submit(fetch_meowfacts, lang, processed_timestamp=processed_timestamp): lang
+            for lang in SUPPORTED_LANGUAGES
+        }
+        for future in as_completed(future_to_lang):
+            lang = future_to_lang[future]
+            try:
+                facts_by_language[lang] = future.result()
+            except (RequestException, ValueError) as e:
+                logger.error(f"Failed to fetch facts for language '{lang}': {e}")
+                failed_languages.append(lang)
+            except Exception as e:
+                logger.exception(f"Unexpected error while fetching facts for language '{lang}': {e}")
+                failed_languages.append(lang)
+
+    # Keep output order stable regardless of completion order
+    all_facts = []
     for lang in SUPPORTED_LANGUAGES:
-        try:
-            facts = fetch_meowfacts(lang)
-            all_facts.extend(facts)
-        except (RequestException, ValueError) as e:
-            logger.error(f"Failed to fetch facts for language '{lang}': {e}")
-            failed_languages.append(lang)
-            continue
-        except Exception as e:
-            logger.exception(f"Unexpected error while fetching facts for language '{lang}': {e}")
-            failed_languages.append(lang)
-            continue
+        all_facts.extend(facts_by_language.get(lang, []))
+    failed_languages.sort(key=SUPPORTED_LANGUAGES.index)
 
     if not all_facts:
         raise ValueError("No facts were successfully fetched from any language")